@@ -9,6 +9,12 @@ __version__ = "0.1.0"
 __author__ = "OSE Team"
 __license__ = "MIT"
 
-from cli.main import cli
-
 __all__ = ["cli"]
+
+
+def __getattr__(name):
+    # Resolve `cli` on first access so importing the package stays cheap
+    if name == "cli":
+        from cli.main import cli
+        return cli
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,31 +7,270 @@ narrowing the architectural search space while educating the engineer
 about the implications of their choices.
 """
 
-import click
-import questionary
-from questionary import Style
+import re
 import sys
-import os
-from typing import Dict, Optional, List
-from pathlib import Path
-import json
-from datetime import datetime
-
-# Custom styling for the Oracle aesthetic
-oracle_style = Style([
-    ('qmark', 'fg:#673ab7 bold'),       # Question mark - deep purple
-    ('question', 'bold'),                # Question text
-    ('answer', 'fg:#2196f3 bold'),      # User's answer - blue
-    ('pointer', 'fg:#673ab7 bold'),     # Selection pointer
-    ('highlighted', 'fg:#673ab7 bold'), # Highlighted choice
-    ('selected', 'fg:#4caf50'),         # Selected choice - green
-    ('separator', 'fg:#cc5454'),        # Separator
-    ('instruction', ''),                # Instructions
-    ('text', ''),                       # Plain text
-    ('disabled', 'fg:#858585 italic')   # Disabled options
-])
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, FrozenSet, NamedTuple, Optional
+
+import click
+
+# Heavy or rarely-needed modules (questionary pulls in prompt_toolkit) are
+# imported inside the functions that use them, so that `docs`, `validate`,
+# `register` and `--version` start without paying for them.
+
+
+def _build_oracle_style():
+    """Custom styling for the Oracle aesthetic."""
+    from questionary import Style
+
+    return Style([
+        ('qmark', 'fg:#673ab7 bold'),       # Question mark - deep purple
+        ('question', 'bold'),                # Question text
+        ('answer', 'fg:#2196f3 bold'),      # User's answer - blue
+        ('pointer', 'fg:#673ab7 bold'),     # Selection pointer
+        ('highlighted', 'fg:#673ab7 bold'), # Highlighted choice
+        ('selected', 'fg:#4caf50'),         # Selected choice - green
+        ('separator', 'fg:#cc5454'),        # Separator
+        ('instruction', ''),                # Instructions
+        ('text', ''),                       # Plain text
+        ('disabled', 'fg:#858585 italic')   # Disabled options
+    ])
+
+
+# Simple keyword matching for "help me decide" (in production, would use NLP).
+# Only the start of a word is anchored so plurals and derived forms
+# ("payments", "authentication") still match, while "bread" or "preview" don't.
+_STRONG_RE = re.compile(
+    r"\b(?:money|payment|financial|transaction|inventory|stock|order|auth|security)",
+    re.IGNORECASE
+)
+_EVENTUAL_RE = re.compile(
+    r"\b(?:feed|timeline|social|analytics|recommendation|cache|view|read)",
+    re.IGNORECASE
+)
+
+
+# Prompt validators: service names are ASCII alphanumerics plus - and _
+# (at least one alphanumeric); counts are positive integers below 10,000,000
+# without leading zeros, so int() on a validated answer cannot fail
+_NAME_RE = re.compile(r"[_-]*[A-Za-z0-9][A-Za-z0-9_-]*")
+_POSINT_RE = re.compile(r"[1-9][0-9]{0,6}")
+
+
+@lru_cache(maxsize=1024)
+def _classify_consistency(use_case: str) -> Optional[str]:
+    """
+    Recommend a consistency model from a one-sentence use case.
+
+    Returns None when no keyword matches, leaving the default to the caller.
+    Callers should normalize the text (strip/lower) so repeats hit the cache.
+    """
+    if _STRONG_RE.search(use_case):
+        return "strong"
+    if _EVENTUAL_RE.search(use_case):
+        return "eventual"
+    return None
+
+
+# The Oracle's banner, styled once at import
+_BANNER_RAW = """
+╔═══════════════════════════════════════════════════════════════╗
+║                                                               ║
+║     ⚡  OMNIFEX SYNTHESIS ENGINE  ⚡                          ║
+║                                                               ║
+║            Your Organizational Architectural Advisor          ║
+║                                                               ║
+║   Drawing from 72 validated patterns across 12 production    ║
+║   services, with 94% average confidence and $5.3M proven     ║
+║   total cost of ownership reduction.                          ║
+║                                                               ║
+╚═══════════════════════════════════════════════════════════════╝
+"""
+_BANNER_STYLED = click.style(_BANNER_RAW, fg='bright_blue', bold=True)
+_BANNER_POSTLUDE = (
+    "\n💡 I'll guide you through designing your new service by asking\n"
+    "   questions about your requirements, then recommend architectural\n"
+    "   patterns based on what others have learned.\n\n"
+    "📚 Press Ctrl+C at any time to save your progress and exit.\n"
+)
+
+# Constraint summary, filled from ServiceConstraints.to_dict() plus two
+# pre-formatted display fields
+_SUMMARY_TEMPLATE = """
+Service Name:        {service_name}
+Service Type:        {service_type}
+Peak Throughput:     {throughput_tps} TPS
+Latency Target:      {latency_p99_ms}ms (p99)
+Consistency Model:   {consistency_model_upper}
+Integrations:        {integrations_fmt}
+Team Size:           {team_size} engineers
+"""
+
+# Section separators, styled once at import
+_SEPARATORS = {
+    fg: click.style("═" * 65, fg=fg)
+    for fg in ('bright_blue', 'bright_green', 'bright_magenta', 'bright_cyan')
+}
+
+
+def _echo_section(title: str, fg: str = 'bright_blue'):
+    """Print a section header (rule, title, rule, blank line) in a single write."""
+    separator = _SEPARATORS[fg]
+    click.echo(f"{separator}\n{click.style(title, fg=fg, bold=True)}\n{separator}\n")
+
+
+@lru_cache(maxsize=None)
+def _progress_path():
+    """Resolve (and create the parent of) ~/.ose/progress.json once per process."""
+    from pathlib import Path
 
+    progress_file = Path.home() / '.ose' / 'progress.json'
+    progress_file.parent.mkdir(exist_ok=True)
+    return progress_file
 
+
+class _ConstraintKey(NamedTuple):
+    service_type: str
+    throughput_tps: int
+    latency_p99_ms: int
+    consistency_model: str
+    integrations: FrozenSet[str]
+    team_size: int
+
+
+@lru_cache(maxsize=128)
+def _recommend_patterns_mock(key: _ConstraintKey) -> tuple:
+    """
+    Mock pattern selection, memoized by constraint signature.
+
+    Week 3: the API round-trip moves here, so re-running `init` with the
+    same answers reuses the earlier recommendation.
+    """
+    patterns = []
+
+    if key.consistency_model == 'strong':
+        patterns.append({
+            'id': 'pattern-023',
+            'name': 'Transactional Outbox Pattern',
+            'confidence': 0.92,
+            'rationale': 'Ensures atomic state changes with event publishing'
+        })
+
+    if key.throughput_tps > 1000:
+        patterns.append({
+            'id': 'pattern-001',
+            'name': 'Actor Mailbox Backpressure',
+            'confidence': 0.95,
+            'rationale': 'Handles high load with graceful degradation'
+        })
+
+    patterns.append({
+        'id': 'pattern-007',
+        'name': 'OpenTelemetry Instrumentation',
+        'confidence': 0.98,
+        'rationale': 'Essential observability for all production services'
+    })
+
+    return tuple(patterns)
+
+
+class _ServiceType(NamedTuple):
+    name: str
+    value: str
+    description: str
+
+
+# Service type - this heavily influences pattern recommendations
+_SERVICE_TYPES = (
+    _ServiceType('🌐 API Service (REST/gRPC)', 'api',
+                 'Synchronous request-response service'),
+    _ServiceType('📨 Event Processor', 'event_processor',
+                 'Consumes events from message queue (Kafka/RabbitMQ)'),
+    _ServiceType('⏰ Background Worker', 'background_worker',
+                 'Scheduled/cron-based batch processing'),
+    _ServiceType('🔄 Stream Processor', 'stream_processor',
+                 'Real-time data transformation pipeline'),
+    _ServiceType('🎯 Specialized (I need help deciding)', 'specialized',
+                 'Custom requirements - OSE will help you choose'),
+)
+
+
+# Throughput guidance per service type: (typical range, default answer, unit)
+_PERF_GUIDANCE = {
+    'api': ("100-10,000 requests/second", "1000", "requests per second"),
+    'event_processor': ("50-5,000 messages/second", "500", "messages per second"),
+}
+_DEFAULT_PERF_GUIDANCE = ("10-1,000 operations/second", "100", "operations per second")
+
+# Educational note shown for each service type once all answers are in
+_SERVICE_TYPE_NOTES = {
+    'api': (
+        "📖 API services typically use:\n"
+        "   • Actor-based concurrency for request isolation\n"
+        "   • Connection pooling for database efficiency\n"
+        "   • Circuit breakers for downstream protection\n"
+    ),
+    'event_processor': (
+        "📖 Event processors typically use:\n"
+        "   • Partition-aware routing for ordered processing\n"
+        "   • Idempotency tokens for exactly-once semantics\n"
+        "   • Dead letter queues for poison message handling\n"
+    ),
+}
+
+
+class _PromptChoices(NamedTuple):
+    service_type: tuple
+    consistency: tuple
+    integration: tuple
+
+
+@lru_cache(maxsize=None)
+def _choices() -> _PromptChoices:
+    """Build the questionary choice lists once and reuse them for every prompt."""
+    import questionary
+
+    service_type = tuple(
+        questionary.Choice(title=f"{t.name}\n   └─ {t.description}", value=t.value)
+        for t in _SERVICE_TYPES
+    )
+
+    consistency = (
+        questionary.Choice(
+            title="🔒 Strong Consistency (ACID transactions)\n   └─ I need guaranteed correctness",
+            value="strong"
+        ),
+        questionary.Choice(
+            title="⏱️  Eventual Consistency\n   └─ I can tolerate temporary inconsistency for speed",
+            value="eventual"
+        ),
+        questionary.Choice(
+            title="🤔 Help me decide based on my use case",
+            value="help"
+        ),
+    )
+
+    # Checkbox selection for multiple integrations
+    integration = (
+        questionary.Choice("📡 Kafka (event streaming)", value="kafka"),
+        questionary.Choice("🗄️  PostgreSQL (relational database)", value="postgresql"),
+        questionary.Choice("🔴 Redis (caching/session store)", value="redis"),
+        questionary.Choice("🔍 Elasticsearch (search/analytics)", value="elasticsearch"),
+        questionary.Choice("☁️  S3 (object storage)", value="s3"),
+        questionary.Choice("🌐 External REST APIs", value="rest_api"),
+        questionary.Choice("⚡ gRPC services", value="grpc"),
+        questionary.Choice("❌ None of the above", value="none"),
+    )
+
+    return _PromptChoices(service_type, consistency, integration)
+
+
+# __slots__ support in dataclasses arrived in Python 3.10
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class ServiceConstraints:
     """
     Structured representation of architectural constraints.
@@ -41,16 +280,15 @@ class ServiceConstraints:
     in the architectural design space.
     """
 
-    def __init__(self):
-        self.service_name: str = ""
-        self.service_type: str = ""
-        self.throughput_tps: int = 0
-        self.latency_p99_ms: int = 0
-        self.consistency_model: str = ""
-        self.integrations: List[str] = []
-        self.data_volume_gb: float = 0.0
-        self.team_size: int = 0
-        self.deployment_target: str = "kubernetes"
+    service_name: str = ""
+    service_type: str = ""
+    throughput_tps: int = 0
+    latency_p99_ms: int = 0
+    consistency_model: str = ""
+    integrations: FrozenSet[str] = frozenset()
+    data_volume_gb: float = 0.0
+    team_size: int = 0
+    deployment_target: str = "kubernetes"
 
     def to_dict(self) -> Dict:
         """Serialize for API transmission."""
@@ -60,7 +298,7 @@ class ServiceConstraints:
             'throughput_tps': self.throughput_tps,
             'latency_p99_ms': self.latency_p99_ms,
             'consistency_model': self.consistency_model,
-            'integrations': self.integrations,
+            'integrations': sorted(self.integrations),
             'data_volume_gb': self.data_volume_gb,
             'team_size': self.team_size,
             'deployment_target': self.deployment_target
@@ -68,13 +306,13 @@ class ServiceConstraints:
 
     def is_complete(self) -> bool:
         """Validate that all required constraints are specified."""
-        return all([
-            self.service_name,
-            self.service_type,
-            self.throughput_tps > 0,
-            self.latency_p99_ms > 0,
-            self.consistency_model
-        ])
+        return bool(
+            self.service_name
+            and self.service_type
+            and self.throughput_tps > 0
+            and self.latency_p99_ms > 0
+            and self.consistency_model
+        )
 
 
 class InteractiveAdvisor:
@@ -86,7 +324,12 @@ class InteractiveAdvisor:
     they actually need, then showing them how others have solved similar problems.
     """
 
+    # Built once on first instantiation and shared by every advisor
+    oracle_style = None
+
     def __init__(self, api_client=None):
+        if InteractiveAdvisor.oracle_style is None:
+            InteractiveAdvisor.oracle_style = _build_oracle_style()
         self.api = api_client  # Will be real API client in Week 3
         self.constraints = ServiceConstraints()
         self.context = {}  # Accumulated context throughout the conversation
@@ -96,12 +339,11 @@ class InteractiveAdvisor:
         self._print_banner()
 
         try:
-            # Progressive constraint gathering - order matters
-            self._gather_basic_identity()
-            self._gather_performance_requirements()
-            self._gather_consistency_requirements()
-            self._gather_integration_requirements()
-            self._gather_team_context()
+            # Ask everything first so no answer waits on derived output
+            self._collect_all_answers()
+
+            # Then explain what those answers imply
+            self._emit_educational_notes(self.constraints)
 
             # Show what we've learned
             self._summarize_constraints()
@@ -120,233 +362,126 @@ class InteractiveAdvisor:
             self._save_progress()
             sys.exit(0)
 
+    def _collect_all_answers(self):
+        """
+        Run the five question phases back to back.
+
+        Each phase stores its answers on self.constraints as soon as the
+        prompt returns, so an interrupted session still saves everything
+        answered so far.
+        """
+        # Progressive constraint gathering - order matters
+        self._gather_basic_identity()
+        self.context['service_type_chosen'] = True
+
+        self._gather_performance_requirements()
+        self._gather_consistency_requirements()
+        self._gather_integration_requirements()
+        self._gather_team_context()
+
     def _print_banner(self):
         """The Oracle announces itself."""
-        banner = """
-╔═══════════════════════════════════════════════════════════════╗
-║                                                               ║
-║     ⚡  OMNIFEX SYNTHESIS ENGINE  ⚡                          ║
-║                                                               ║
-║            Your Organizational Architectural Advisor          ║
-║                                                               ║
-║   Drawing from 72 validated patterns across 12 production    ║
-║   services, with 94% average confidence and $5.3M proven     ║
-║   total cost of ownership reduction.                          ║
-║                                                               ║
-╚═══════════════════════════════════════════════════════════════╝
-        """
-        click.echo(click.style(banner, fg='bright_blue', bold=True))
-        click.echo("\n💡 I'll guide you through designing your new service by asking")
-        click.echo("   questions about your requirements, then recommend architectural")
-        click.echo("   patterns based on what others have learned.\n")
-        click.echo("📚 Press Ctrl+C at any time to save your progress and exit.\n")
+        click.echo(_BANNER_STYLED)
+        click.echo(_BANNER_POSTLUDE)
 
     def _gather_basic_identity(self):
         """Phase 1: Establish basic service identity."""
-        click.echo(click.style("═" * 65, fg='bright_blue'))
-        click.echo(click.style("PHASE 1: SERVICE IDENTITY", fg='bright_blue', bold=True))
-        click.echo(click.style("═" * 65, fg='bright_blue'))
-        click.echo()
+        import questionary
+
+        _echo_section("PHASE 1: SERVICE IDENTITY")
 
         # Service name
         self.constraints.service_name = questionary.text(
             "What is the name of your service?",
-            style=oracle_style,
-            validate=lambda text: len(text) > 0 and text.replace('-', '').replace('_', '').isalnum(),
+            style=self.oracle_style,
+            validate=lambda text: _NAME_RE.fullmatch(text) is not None,
             instruction="(Use lowercase with hyphens, e.g., 'inventory-manager')"
         ).ask()
 
-        click.echo()
-
         # Service type - this heavily influences pattern recommendations
-        service_types = [
-            {
-                'name': '🌐 API Service (REST/gRPC)',
-                'value': 'api',
-                'description': 'Synchronous request-response service'
-            },
-            {
-                'name': '📨 Event Processor',
-                'value': 'event_processor',
-                'description': 'Consumes events from message queue (Kafka/RabbitMQ)'
-            },
-            {
-                'name': '⏰ Background Worker',
-                'value': 'background_worker',
-                'description': 'Scheduled/cron-based batch processing'
-            },
-            {
-                'name': '🔄 Stream Processor',
-                'value': 'stream_processor',
-                'description': 'Real-time data transformation pipeline'
-            },
-            {
-                'name': '🎯 Specialized (I need help deciding)',
-                'value': 'specialized',
-                'description': 'Custom requirements - OSE will help you choose'
-            }
-        ]
-
-        choice = questionary.select(
+        self.constraints.service_type = questionary.select(
             "What type of service are you building?",
-            choices=[
-                questionary.Choice(
-                    title=f"{t['name']}\n   └─ {t['description']}",
-                    value=t['value']
-                )
-                for t in service_types
-            ],
-            style=oracle_style
+            choices=_choices().service_type,
+            style=self.oracle_style
         ).ask()
 
-        self.constraints.service_type = choice
-        self.context['service_type_chosen'] = True
-
-        click.echo()
-
-        # Educational moment based on choice
-        if choice == 'api':
-            click.echo("📖 API services typically use:")
-            click.echo("   • Actor-based concurrency for request isolation")
-            click.echo("   • Connection pooling for database efficiency")
-            click.echo("   • Circuit breakers for downstream protection")
-        elif choice == 'event_processor':
-            click.echo("📖 Event processors typically use:")
-            click.echo("   • Partition-aware routing for ordered processing")
-            click.echo("   • Idempotency tokens for exactly-once semantics")
-            click.echo("   • Dead letter queues for poison message handling")
-
         click.echo()
 
     def _gather_performance_requirements(self):
         """Phase 2: Establish performance envelope."""
-        click.echo(click.style("═" * 65, fg='bright_blue'))
-        click.echo(click.style("PHASE 2: PERFORMANCE REQUIREMENTS", fg='bright_blue', bold=True))
-        click.echo(click.style("═" * 65, fg='bright_blue'))
-        click.echo()
+        _echo_section("PHASE 2: PERFORMANCE REQUIREMENTS")
+
+        service_type = self.constraints.service_type
 
         # Throughput - adapt guidance based on service type
-        if self.constraints.service_type == 'api':
-            typical_range = "100-10,000 requests/second"
-            default_value = "1000"
-            unit = "requests per second"
-        elif self.constraints.service_type == 'event_processor':
-            typical_range = "50-5,000 messages/second"
-            default_value = "500"
-            unit = "messages per second"
-        else:
-            typical_range = "10-1,000 operations/second"
-            default_value = "100"
-            unit = "operations per second"
+        typical_range, default_value, unit = _PERF_GUIDANCE.get(
+            service_type, _DEFAULT_PERF_GUIDANCE
+        )
 
-        click.echo(f"📊 Typical range for {self.constraints.service_type}: {typical_range}")
+        click.echo(f"📊 Typical range for {service_type}: {typical_range}")
         click.echo()
 
-        throughput_str = questionary.text(
-            f"Expected peak throughput ({unit})?",
-            default=default_value,
-            style=oracle_style,
-            validate=lambda text: text.isdigit() and int(text) > 0
-        ).ask()
-
-        self.constraints.throughput_tps = int(throughput_str)
+        self.constraints.throughput_tps = self._ask_positive_int(
+            f"Expected peak throughput ({unit})?", default=default_value
+        )
 
         click.echo()
 
         # Latency - critical for pattern selection (Actor vs Thread Pool, etc.)
-        click.echo("📊 Latency target determines concurrency model:")
-        click.echo("   • < 50ms:  Requires careful optimization, actor-based concurrency")
-        click.echo("   • 50-200ms: Standard for most APIs, flexible architecture")
-        click.echo("   • > 200ms: Can use simpler threading models")
-        click.echo()
-
-        latency_str = questionary.text(
-            "Target p99 latency (milliseconds)?",
-            default="100",
-            style=oracle_style,
-            validate=lambda text: text.isdigit() and int(text) > 0
-        ).ask()
+        click.echo(
+            "📊 Latency target determines concurrency model:\n"
+            "   • < 50ms:  Requires careful optimization, actor-based concurrency\n"
+            "   • 50-200ms: Standard for most APIs, flexible architecture\n"
+            "   • > 200ms: Can use simpler threading models\n"
+        )
 
-        self.constraints.latency_p99_ms = int(latency_str)
-
-        click.echo()
-
-        # Performance assessment
-        if self.constraints.throughput_tps > 5000 and self.constraints.latency_p99_ms < 50:
-            click.echo("⚠️  High throughput + low latency detected!")
-            click.echo("   OSE will recommend aggressive optimization patterns:")
-            click.echo("   • Zero-allocation request handling")
-            click.echo("   • Connection pooling with pre-warming")
-            click.echo("   • Careful memory management")
+        self.constraints.latency_p99_ms = self._ask_positive_int(
+            "Target p99 latency (milliseconds)?", default="100"
+        )
 
         click.echo()
 
     def _gather_consistency_requirements(self):
         """Phase 3: Consistency model - perhaps the most architecturally significant choice."""
-        click.echo(click.style("═" * 65, fg='bright_blue'))
-        click.echo(click.style("PHASE 3: DATA CONSISTENCY MODEL", fg='bright_blue', bold=True))
-        click.echo(click.style("═" * 65, fg='bright_blue'))
-        click.echo()
-
-        click.echo("🎓 CONSISTENCY FUNDAMENTALS:")
-        click.echo()
-        click.echo("Strong Consistency (ACID):")
-        click.echo("  ✓ Reads always see the latest write")
-        click.echo("  ✓ Transactions are atomic")
-        click.echo("  ✗ Higher latency (requires coordination)")
-        click.echo("  ✗ Lower throughput (serialization overhead)")
-        click.echo("  → Use for: Financial transactions, inventory, user authentication")
-        click.echo()
-        click.echo("Eventual Consistency:")
-        click.echo("  ✓ Very high throughput")
-        click.echo("  ✓ Low latency (no coordination)")
-        click.echo("  ✗ Reads may see stale data temporarily")
-        click.echo("  ✗ Complex conflict resolution")
-        click.echo("  → Use for: Social media feeds, analytics, caching, recommendations")
-        click.echo()
-
-        consistency_choices = [
-            questionary.Choice(
-                title="🔒 Strong Consistency (ACID transactions)\n   └─ I need guaranteed correctness",
-                value="strong"
-            ),
-            questionary.Choice(
-                title="⏱️  Eventual Consistency\n   └─ I can tolerate temporary inconsistency for speed",
-                value="eventual"
-            ),
-            questionary.Choice(
-                title="🤔 Help me decide based on my use case",
-                value="help"
-            )
-        ]
+        import questionary
+
+        _echo_section("PHASE 3: DATA CONSISTENCY MODEL")
+
+        click.echo(
+            "🎓 CONSISTENCY FUNDAMENTALS:\n\n"
+            "Strong Consistency (ACID):\n"
+            "  ✓ Reads always see the latest write\n"
+            "  ✓ Transactions are atomic\n"
+            "  ✗ Higher latency (requires coordination)\n"
+            "  ✗ Lower throughput (serialization overhead)\n"
+            "  → Use for: Financial transactions, inventory, user authentication\n\n"
+            "Eventual Consistency:\n"
+            "  ✓ Very high throughput\n"
+            "  ✓ Low latency (no coordination)\n"
+            "  ✗ Reads may see stale data temporarily\n"
+            "  ✗ Complex conflict resolution\n"
+            "  → Use for: Social media feeds, analytics, caching, recommendations\n"
+        )
 
         choice = questionary.select(
             "Which consistency model fits your requirements?",
-            choices=consistency_choices,
-            style=oracle_style
+            choices=_choices().consistency,
+            style=self.oracle_style
         ).ask()
 
         if choice == "help":
             # Decision tree based on gathered context
             use_case = questionary.text(
                 "Describe your primary use case in one sentence:",
-                style=oracle_style
+                style=self.oracle_style
             ).ask()
 
-            # Simple keyword matching (in production, would use NLP)
-            strong_indicators = ['money', 'payment', 'financial', 'transaction',
-                               'inventory', 'stock', 'order', 'auth', 'security']
-            eventual_indicators = ['feed', 'timeline', 'social', 'analytics',
-                                 'recommendation', 'cache', 'view', 'read']
+            recommendation = _classify_consistency(use_case.strip().lower())
 
-            use_case_lower = use_case.lower()
-
-            if any(indicator in use_case_lower for indicator in strong_indicators):
-                recommendation = "strong"
+            if recommendation == "strong":
                 click.echo("\n💡 Based on your use case, I recommend Strong Consistency.")
                 click.echo("   Keywords detected: financial/transactional domain")
-            elif any(indicator in use_case_lower for indicator in eventual_indicators):
-                recommendation = "eventual"
+            elif recommendation == "eventual":
                 click.echo("\n💡 Based on your use case, I recommend Eventual Consistency.")
                 click.echo("   Keywords detected: read-heavy/analytical domain")
             else:
@@ -357,7 +492,7 @@ class InteractiveAdvisor:
             confirmed = questionary.confirm(
                 f"Proceed with {recommendation.upper()} consistency?",
                 default=True,
-                style=oracle_style
+                style=self.oracle_style
             ).ask()
 
             if confirmed:
@@ -367,178 +502,159 @@ class InteractiveAdvisor:
                 choice = questionary.select(
                     "Which would you prefer?",
                     choices=["strong", "eventual"],
-                    style=oracle_style
+                    style=self.oracle_style
                 ).ask()
 
-        self.constraints.consistency_model = choice
-
         click.echo()
 
-        # Architectural implications
-        if choice == "strong":
-            click.echo("📐 Strong consistency enables:")
-            click.echo("   • Two-phase commit for distributed transactions")
-            click.echo("   • Transactional outbox pattern for event publishing")
-            click.echo("   • Serializable isolation levels")
-        else:
-            click.echo("📐 Eventual consistency enables:")
-            click.echo("   • Event sourcing for audit trails")
-            click.echo("   • CQRS for read/write separation")
-            click.echo("   • Conflict-free replicated data types (CRDTs)")
-
-        click.echo()
+        self.constraints.consistency_model = choice
 
     def _gather_integration_requirements(self):
         """Phase 4: Integration points - determines interface patterns."""
-        click.echo(click.style("═" * 65, fg='bright_blue'))
-        click.echo(click.style("PHASE 4: INTEGRATION REQUIREMENTS", fg='bright_blue', bold=True))
-        click.echo(click.style("═" * 65, fg='bright_blue'))
-        click.echo()
+        import questionary
 
-        # Checkbox selection for multiple integrations
-        integration_options = [
-            questionary.Choice("📡 Kafka (event streaming)", value="kafka"),
-            questionary.Choice("🗄️  PostgreSQL (relational database)", value="postgresql"),
-            questionary.Choice("🔴 Redis (caching/session store)", value="redis"),
-            questionary.Choice("🔍 Elasticsearch (search/analytics)", value="elasticsearch"),
-            questionary.Choice("☁️  S3 (object storage)", value="s3"),
-            questionary.Choice("🌐 External REST APIs", value="rest_api"),
-            questionary.Choice("⚡ gRPC services", value="grpc"),
-            questionary.Choice("❌ None of the above", value="none")
-        ]
+        _echo_section("PHASE 4: INTEGRATION REQUIREMENTS")
 
         selected = questionary.checkbox(
             "Which external systems will your service integrate with?",
-            choices=integration_options,
-            style=oracle_style
+            choices=_choices().integration,
+            style=self.oracle_style
         ).ask()
 
         # Filter out 'none'
-        self.constraints.integrations = [s for s in selected if s != 'none']
+        self.constraints.integrations = frozenset(s for s in selected if s != 'none')
 
         click.echo()
 
-        # Pattern implications
-        if 'kafka' in self.constraints.integrations:
-            click.echo("📨 Kafka integration detected:")
-            click.echo("   • OSE will include transactional outbox pattern")
-            click.echo("   • Exactly-once delivery semantics")
-            click.echo("   • Partition-aware consumer configuration")
+    def _gather_team_context(self):
+        """Phase 5: Team context - affects architectural complexity choices."""
+        _echo_section("PHASE 5: TEAM CONTEXT")
 
-        if 'postgresql' in self.constraints.integrations:
-            click.echo("🗄️  PostgreSQL integration detected:")
-            click.echo("   • OSE will include connection pooling")
-            click.echo("   • Prepared statement optimization")
-            click.echo("   • Migration framework (golang-migrate)")
+        click.echo(
+            "🎓 Team size influences architectural complexity:\n"
+            "   • 1-2 engineers: Simpler patterns, less abstraction\n"
+            "   • 3-5 engineers: Standard microservice patterns\n"
+            "   • 6+ engineers: Can handle more sophisticated architectures\n"
+        )
 
-        click.echo()
+        self.constraints.team_size = self._ask_positive_int(
+            "How many engineers will maintain this service?", default="3"
+        )
 
-    def _gather_team_context(self):
-        """Phase 5: Team context - affects architectural complexity choices."""
-        click.echo(click.style("═" * 65, fg='bright_blue'))
-        click.echo(click.style("PHASE 5: TEAM CONTEXT", fg='bright_blue', bold=True))
-        click.echo(click.style("═" * 65, fg='bright_blue'))
         click.echo()
 
-        click.echo("🎓 Team size influences architectural complexity:")
-        click.echo("   • 1-2 engineers: Simpler patterns, less abstraction")
-        click.echo("   • 3-5 engineers: Standard microservice patterns")
-        click.echo("   • 6+ engineers: Can handle more sophisticated architectures")
-        click.echo()
+    def _ask_positive_int(self, message: str, default: str) -> int:
+        """Prompt for a positive integer, parsing the validated answer once."""
+        import questionary
 
-        team_size_str = questionary.text(
-            "How many engineers will maintain this service?",
-            default="3",
-            style=oracle_style,
-            validate=lambda text: text.isdigit() and int(text) > 0
+        answer = questionary.text(
+            message,
+            default=default,
+            style=self.oracle_style,
+            validate=lambda text: _POSINT_RE.fullmatch(text) is not None
         ).ask()
 
-        self.constraints.team_size = int(team_size_str)
+        return int(answer)
 
-        click.echo()
+    def _emit_educational_notes(self, constraints: ServiceConstraints):
+        """Explain what the collected answers imply, once every question is answered."""
+        _echo_section("WHAT YOUR ANSWERS IMPLY")
+
+        # Service type
+        note = _SERVICE_TYPE_NOTES.get(constraints.service_type)
+        if note:
+            click.echo(note)
 
-        if self.constraints.team_size <= 2:
-            click.echo("📝 Small team detected:")
-            click.echo("   • OSE will favor simpler patterns")
-            click.echo("   • Reduced abstraction layers")
-            click.echo("   • Comprehensive documentation for knowledge transfer")
+        # Performance assessment
+        if constraints.throughput_tps > 5000 and constraints.latency_p99_ms < 50:
+            click.echo(
+                "⚠️  High throughput + low latency detected!\n"
+                "   OSE will recommend aggressive optimization patterns:\n"
+                "   • Zero-allocation request handling\n"
+                "   • Connection pooling with pre-warming\n"
+                "   • Careful memory management\n"
+            )
 
+        # Architectural implications of the consistency model
+        if constraints.consistency_model == "strong":
+            click.echo(
+                "📐 Strong consistency enables:\n"
+                "   • Two-phase commit for distributed transactions\n"
+                "   • Transactional outbox pattern for event publishing\n"
+                "   • Serializable isolation levels"
+            )
+        else:
+            click.echo(
+                "📐 Eventual consistency enables:\n"
+                "   • Event sourcing for audit trails\n"
+                "   • CQRS for read/write separation\n"
+                "   • Conflict-free replicated data types (CRDTs)"
+            )
         click.echo()
 
+        # Integration pattern implications
+        if 'kafka' in constraints.integrations:
+            click.echo(
+                "📨 Kafka integration detected:\n"
+                "   • OSE will include transactional outbox pattern\n"
+                "   • Exactly-once delivery semantics\n"
+                "   • Partition-aware consumer configuration\n"
+            )
+
+        if 'postgresql' in constraints.integrations:
+            click.echo(
+                "🗄️  PostgreSQL integration detected:\n"
+                "   • OSE will include connection pooling\n"
+                "   • Prepared statement optimization\n"
+                "   • Migration framework (golang-migrate)\n"
+            )
+
+        if constraints.team_size <= 2:
+            click.echo(
+                "📝 Small team detected:\n"
+                "   • OSE will favor simpler patterns\n"
+                "   • Reduced abstraction layers\n"
+                "   • Comprehensive documentation for knowledge transfer\n"
+            )
+
     def _summarize_constraints(self):
         """Show what the Oracle has learned."""
-        click.echo(click.style("═" * 65, fg='bright_green'))
-        click.echo(click.style("CONSTRAINT SUMMARY", fg='bright_green', bold=True))
-        click.echo(click.style("═" * 65, fg='bright_green'))
-        click.echo()
+        _echo_section("CONSTRAINT SUMMARY", 'bright_green')
 
-        summary = f"""
-Service Name:        {self.constraints.service_name}
-Service Type:        {self.constraints.service_type}
-Peak Throughput:     {self.constraints.throughput_tps} TPS
-Latency Target:      {self.constraints.latency_p99_ms}ms (p99)
-Consistency Model:   {self.constraints.consistency_model.upper()}
-Integrations:        {', '.join(self.constraints.integrations) if self.constraints.integrations else 'None'}
-Team Size:           {self.constraints.team_size} engineers
-        """
+        ctx = self.constraints.to_dict()
+        ctx['consistency_model_upper'] = ctx['consistency_model'].upper()
+        ctx['integrations_fmt'] = ', '.join(ctx['integrations']) or 'None'
 
-        click.echo(summary)
+        click.echo(_SUMMARY_TEMPLATE.format_map(ctx))
 
     def _confirm_proceed(self) -> bool:
         """Final confirmation before generation."""
+        import questionary
+
         return questionary.confirm(
             "Proceed with blueprint generation?",
             default=True,
-            style=oracle_style
+            style=self.oracle_style
         ).ask()
 
     def _generate_blueprint_mock(self) -> Dict:
         """
         Week 1: Mock implementation.
         Week 3: Replace with actual API call.
+
+        Pattern dicts are shared with the recommendation cache and must not
+        be mutated.
         """
-        # Simulate "thinking"
-        import time
-        with click.progressbar(
-            length=100,
-            label='🧠 Analyzing constraints against Pattern Library...',
-            fill_char='█',
-            empty_char='░'
-        ) as bar:
-            for i in range(100):
-                time.sleep(0.02)
-                bar.update(1)
-
-        # Mock blueprint based on constraints
-        patterns = []
-
-        if self.constraints.consistency_model == 'strong':
-            patterns.append({
-                'id': 'pattern-023',
-                'name': 'Transactional Outbox Pattern',
-                'confidence': 0.92,
-                'rationale': 'Ensures atomic state changes with event publishing'
-            })
-
-        if self.constraints.throughput_tps > 1000:
-            patterns.append({
-                'id': 'pattern-001',
-                'name': 'Actor Mailbox Backpressure',
-                'confidence': 0.95,
-                'rationale': 'Handles high load with graceful degradation'
-            })
+        # Week 3: drive a click.progressbar from the streamed API response,
+        # one update per pattern received, instead of a fixed animation.
+        click.echo("🧠 Analyzing constraints against Pattern Library...")
 
-        patterns.append({
-            'id': 'pattern-007',
-            'name': 'OpenTelemetry Instrumentation',
-            'confidence': 0.98,
-            'rationale': 'Essential observability for all production services'
-        })
+        patterns = _recommend_patterns_mock(self._constraint_key())
 
         return {
             'service_name': self.constraints.service_name,
             'confidence': 0.87,  # Mock confidence
-            'patterns': patterns,
+            'patterns': list(patterns),
             'artifacts': [
                 {'type': 'proto', 'path': f'proto/{self.constraints.service_name}/v1/service.proto'},
                 {'type': 'sql', 'path': 'db/schema.sql'},
@@ -547,23 +663,40 @@ Team Size:           {self.constraints.team_size} engineers
             ]
         }
 
+    def _constraint_key(self) -> _ConstraintKey:
+        """
+        Hashable signature of the constraints that drive pattern selection.
+
+        The service name is deliberately left out: renaming a service does
+        not change which patterns it needs.
+        """
+        c = self.constraints
+        return _ConstraintKey(
+            service_type=c.service_type,
+            throughput_tps=c.throughput_tps,
+            latency_p99_ms=c.latency_p99_ms,
+            consistency_model=c.consistency_model,
+            integrations=c.integrations,
+            team_size=c.team_size,
+        )
+
     def _display_blueprint(self, blueprint: Dict):
-        """Render the generated blueprint."""
-        click.echo()
-        click.echo(click.style("═" * 65, fg='bright_magenta'))
-        click.echo(click.style("ARCHITECTURAL BLUEPRINT GENERATED", fg='bright_magenta', bold=True))
-        click.echo(click.style("═" * 65, fg='bright_magenta'))
+        """Render the generated blueprint; 'patterns' may be any iterable."""
         click.echo()
+        _echo_section("ARCHITECTURAL BLUEPRINT GENERATED", 'bright_magenta')
 
-        click.echo(f"Service:           {blueprint['service_name']}")
-        click.echo(f"Overall Confidence: {blueprint['confidence']:.0%}")
-        click.echo()
+        click.echo(
+            f"Service:           {blueprint['service_name']}\n"
+            f"Overall Confidence: {blueprint['confidence']:.0%}\n"
+        )
 
         click.echo(click.style("RECOMMENDED PATTERNS:", bold=True))
         for i, pattern in enumerate(blueprint['patterns'], 1):
-            click.echo(f"\n{i}. {pattern['name']} (ID: {pattern['id']})")
-            click.echo(f"   Confidence: {pattern['confidence']:.0%}")
-            click.echo(f"   Why: {pattern['rationale']}")
+            click.echo(
+                f"\n{i}. {pattern['name']} (ID: {pattern['id']})\n"
+                f"   Confidence: {pattern['confidence']:.0%}\n"
+                f"   Why: {pattern['rationale']}"
+            )
 
         click.echo()
         click.echo(click.style("GENERATED ARTIFACTS:", bold=True))
@@ -574,29 +707,35 @@ Team Size:           {self.constraints.team_size} engineers
 
     def _write_artifacts_mock(self, blueprint: Dict):
         """Week 1: Create placeholder files. Week 7: Actual template generation."""
+        from datetime import datetime
+        from pathlib import Path
+
         service_dir = blueprint['service_name']
-        Path(service_dir).mkdir(exist_ok=True)
+        base = Path(service_dir)
+        base.mkdir(exist_ok=True)
+
+        # Every stub shares the same header, so render and encode it once
+        header = (
+            f"# Generated by OSE Advisory Service\n"
+            f"# Service: {blueprint['service_name']}\n"
+            f"# Generated: {datetime.now().isoformat()}\n\n"
+            f"# TODO: Full template generation in Week 7\n"
+        ).encode()
+
+        # Create each parent directory once, then the stub files
+        parents = {(base / a['path']).parent for a in blueprint['artifacts']}
+        for parent in parents:
+            parent.mkdir(parents=True, exist_ok=True)
 
-        # Create stub files
         for artifact in blueprint['artifacts']:
-            filepath = Path(service_dir) / artifact['path']
-            filepath.parent.mkdir(parents=True, exist_ok=True)
-
-            with open(filepath, 'w') as f:
-                f.write(f"# Generated by OSE Advisory Service\n")
-                f.write(f"# Service: {blueprint['service_name']}\n")
-                f.write(f"# Generated: {datetime.now().isoformat()}\n\n")
-                f.write(f"# TODO: Full template generation in Week 7\n")
+            (base / artifact['path']).write_bytes(header)
 
         click.echo(f"✨ Created {len(blueprint['artifacts'])} starter files in ./{service_dir}/")
 
     def _show_next_steps(self):
         """Guide the engineer forward."""
         click.echo()
-        click.echo(click.style("═" * 65, fg='bright_cyan'))
-        click.echo(click.style("NEXT STEPS", fg='bright_cyan', bold=True))
-        click.echo(click.style("═" * 65, fg='bright_cyan'))
-        click.echo()
+        _echo_section("NEXT STEPS", 'bright_cyan')
 
         steps = [
             "📖 Review docs/ARCHITECTURE.md to understand the design decisions",
@@ -608,20 +747,30 @@ Team Size:           {self.constraints.team_size} engineers
             "📊 Run 'ose-cli register' to share telemetry with Pattern Library"
         ]
 
-        for i, step in enumerate(steps, 1):
-            click.echo(f"{i}. {step}")
-
-        click.echo()
-        click.echo(click.style("Questions? Run 'ose-cli docs' or visit #architecture-guild", fg='bright_cyan'))
-        click.echo()
+        numbered = "\n".join(f"{i}. {step}" for i, step in enumerate(steps, 1))
+        footer = click.style(
+            "Questions? Run 'ose-cli docs' or visit #architecture-guild", fg='bright_cyan'
+        )
+        click.echo(f"{numbered}\n\n{footer}\n")
 
     def _save_progress(self):
         """Save partial constraints for later resumption."""
-        progress_file = Path.home() / '.ose' / 'progress.json'
-        progress_file.parent.mkdir(exist_ok=True)
+        import json
+        import os
 
-        with open(progress_file, 'w') as f:
-            json.dump(self.constraints.to_dict(), f, indent=2)
+        progress_file = _progress_path()
+
+        # orjson is an optional accelerator; stdlib json is always available
+        try:
+            import orjson
+            payload = orjson.dumps(self.constraints.to_dict(), option=orjson.OPT_INDENT_2)
+        except ImportError:
+            payload = json.dumps(self.constraints.to_dict(), indent=2).encode()
+
+        # Write then rename, so a second Ctrl+C can't leave a truncated file behind
+        tmp_file = progress_file.with_suffix('.json.tmp')
+        tmp_file.write_bytes(payload)
+        os.replace(tmp_file, progress_file)
 
         click.echo(f"💾 Progress saved to {progress_file}")
 
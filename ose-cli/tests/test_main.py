@@ -2,14 +2,60 @@
 Tests for OSE Advisory CLI
 
 Week 1-2: Basic functionality tests
-Week 3+: Integration tests with real API
+Week 3+: Integration tests with real API (tests/integration/)
 """
 
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+if __name__ == '__main__':
+    # Standalone runs write no .pyc for cli/ or pytest's assertion rewrites;
+    # this has to happen before cli.main is imported below
+    sys.dont_write_bytecode = True
+
 import pytest
 from click.testing import CliRunner
-from cli.main import cli, ServiceConstraints, InteractiveAdvisor
+from cli.main import cli, ServiceConstraints, InteractiveAdvisor, _classify_consistency
+
+
+# Group help text, then the commands in Click's (alphabetical) listing order
+_HELP_RE = re.compile(r'OSE Advisory CLI.*\binit\b.*\bregister\b.*\bvalidate\b', re.DOTALL)
+
+
+@pytest.fixture(scope="module")
+def runner():
+    """Shared CLI runner; each invoke() is already isolated."""
+    return CliRunner()
+
+
+@pytest.fixture(scope="module")
+def help_result(runner):
+    """`--help` output, rendered once for every help-text assertion."""
+    return runner.invoke(cli, ['--help'], catch_exceptions=False)
 
 
+@pytest.fixture(scope="module")
+def configured_advisor():
+    """Advisor with high-throughput, strongly consistent API constraints."""
+    advisor = InteractiveAdvisor()
+    advisor.constraints = ServiceConstraints(
+        service_name="test-service",
+        service_type="api",
+        throughput_tps=2000,
+        consistency_model="strong",
+    )
+    return advisor
+
+
+@pytest.fixture(scope="module")
+def mock_blueprint(configured_advisor):
+    """Mock blueprint for configured_advisor, generated once per module."""
+    return configured_advisor._generate_blueprint_mock()
+
+
+@pytest.mark.fast
 class TestServiceConstraints:
     """Test the ServiceConstraints data model."""
 
@@ -21,18 +67,19 @@ class TestServiceConstraints:
         assert constraints.throughput_tps == 0
         assert constraints.latency_p99_ms == 0
         assert constraints.consistency_model == ""
-        assert constraints.integrations == []
+        assert constraints.integrations == frozenset()
         assert constraints.team_size == 0
         assert constraints.deployment_target == "kubernetes"
 
     def test_to_dict(self):
         """Test serialization to dictionary."""
-        constraints = ServiceConstraints()
-        constraints.service_name = "test-service"
-        constraints.service_type = "api"
-        constraints.throughput_tps = 1000
-        constraints.latency_p99_ms = 100
-        constraints.consistency_model = "strong"
+        constraints = ServiceConstraints(
+            service_name="test-service",
+            service_type="api",
+            throughput_tps=1000,
+            latency_p99_ms=100,
+            consistency_model="strong",
+        )
 
         result = constraints.to_dict()
 
@@ -42,73 +89,70 @@ class TestServiceConstraints:
         assert result['latency_p99_ms'] == 100
         assert result['consistency_model'] == "strong"
 
-    def test_is_complete_valid(self):
-        """Test that is_complete returns True for fully specified constraints."""
-        constraints = ServiceConstraints()
-        constraints.service_name = "test-service"
-        constraints.service_type = "api"
-        constraints.throughput_tps = 1000
-        constraints.latency_p99_ms = 100
-        constraints.consistency_model = "strong"
-
-        assert constraints.is_complete() is True
-
-    def test_is_complete_invalid(self):
-        """Test that is_complete returns False for incomplete constraints."""
-        constraints = ServiceConstraints()
-        constraints.service_name = "test-service"
+    @pytest.mark.parametrize("fields,expected", [
+        ({
+            "service_name": "test-service",
+            "service_type": "api",
+            "throughput_tps": 1000,
+            "latency_p99_ms": 100,
+            "consistency_model": "strong",
+        }, True),
         # Missing other required fields
-
-        assert constraints.is_complete() is False
+        ({"service_name": "test-service"}, False),
+    ])
+    def test_is_complete(self, fields, expected):
+        """Test that is_complete reflects whether required constraints are set."""
+        assert ServiceConstraints(**fields).is_complete() is expected
 
 
 class TestCLI:
     """Test the CLI commands."""
 
-    def test_cli_help(self):
+    def test_cli_help(self, help_result):
         """Test that the CLI shows help."""
-        runner = CliRunner()
-        result = runner.invoke(cli, ['--help'])
-
-        assert result.exit_code == 0
-        assert 'OSE Advisory CLI' in result.output
-        assert 'init' in result.output
-        assert 'validate' in result.output
-        assert 'register' in result.output
-
-    def test_cli_version(self):
+        assert help_result.exit_code == 0
+        assert _HELP_RE.search(help_result.output)
+
+    def test_import_does_not_load_questionary(self):
+        """Test that importing the CLI defers questionary/prompt_toolkit."""
+        code = (
+            "import sys, cli.main; "
+            "sys.exit(any(m in sys.modules for m in ('questionary', 'prompt_toolkit')))"
+        )
+        result = subprocess.run(
+            [sys.executable, '-c', code], cwd=Path(__file__).resolve().parents[1]
+        )
+
+        assert result.returncode == 0
+
+    def test_cli_version(self, runner):
         """Test that the CLI shows version."""
-        runner = CliRunner()
-        result = runner.invoke(cli, ['--version'])
+        result = runner.invoke(cli, ['--version'], catch_exceptions=False)
 
         assert result.exit_code == 0
         assert '0.1.0' in result.output
 
-    def test_docs_command(self):
+    def test_docs_command(self, runner):
         """Test the docs command."""
-        runner = CliRunner()
-        result = runner.invoke(cli, ['docs'])
+        result = runner.invoke(cli, ['docs'], catch_exceptions=False)
 
         assert result.exit_code == 0
-        assert 'documentation' in result.output.lower()
+        assert re.search(r'documentation', result.output, re.IGNORECASE)
 
-    def test_validate_command_stub(self):
-        """Test the validate command (stub implementation)."""
-        runner = CliRunner()
-        result = runner.invoke(cli, ['validate'])
+    @pytest.mark.parametrize("command,needle", [
+        ("validate", "Scanning"),
+        ("register", "Registering"),
+    ])
+    def test_command_stub(self, runner, command, needle):
+        """Test the Week 10 stub commands."""
+        # The stubs need none of Click's standalone exit handling
+        result = runner.invoke(cli, [command], catch_exceptions=False, standalone_mode=False)
 
         assert result.exit_code == 0
-        assert 'Scanning' in result.output or 'Week 10' in result.output
-
-    def test_register_command_stub(self):
-        """Test the register command (stub implementation)."""
-        runner = CliRunner()
-        result = runner.invoke(cli, ['register'])
-
-        assert result.exit_code == 0
-        assert 'Registering' in result.output or 'Week 10' in result.output
+        assert needle in result.output or 'Week 10' in result.output
 
 
+@pytest.mark.fast
 class TestInteractiveAdvisor:
     """Test the InteractiveAdvisor class."""
 
@@ -118,48 +162,91 @@ class TestInteractiveAdvisor:
 
         assert advisor.api is None
         assert isinstance(advisor.constraints, ServiceConstraints)
-        assert isinstance(advisor.context, dict)
-        assert len(advisor.context) == 0
+        assert advisor.context == {}
 
-    def test_generate_blueprint_mock(self):
+    def test_blueprint_structure(self, mock_blueprint):
         """Test mock blueprint generation."""
-        advisor = InteractiveAdvisor()
-
-        # Set up some constraints
-        advisor.constraints.service_name = "test-service"
-        advisor.constraints.service_type = "api"
-        advisor.constraints.throughput_tps = 2000
-        advisor.constraints.consistency_model = "strong"
-
-        blueprint = advisor._generate_blueprint_mock()
-
-        # Verify blueprint structure
-        assert blueprint['service_name'] == "test-service"
-        assert 'patterns' in blueprint
-        assert 'artifacts' in blueprint
-        assert 'confidence' in blueprint
-
-        # Verify high throughput triggers Actor pattern
-        pattern_names = [p['name'] for p in blueprint['patterns']]
-        assert any('Actor' in name for name in pattern_names)
-
-        # Verify strong consistency triggers Transactional Outbox
-        assert any('Transactional Outbox' in name for name in pattern_names)
-
-
-# Integration tests for Week 3+
-@pytest.mark.skip(reason="API integration not yet implemented")
-class TestAPIIntegration:
-    """Integration tests with real API (Week 3+)."""
-
-    def test_generate_blueprint_real_api(self):
-        """Test blueprint generation with real API."""
-        pass
-
-    def test_pattern_search_real_api(self):
-        """Test pattern search with real API."""
-        pass
+        assert mock_blueprint['service_name'] == "test-service"
+        assert 'patterns' in mock_blueprint
+        assert 'artifacts' in mock_blueprint
+        assert 'confidence' in mock_blueprint
+
+    def test_high_throughput_recommends_actor(self, mock_blueprint):
+        """Test that high throughput triggers the Actor pattern."""
+        pattern_names = "\n".join(p['name'] for p in mock_blueprint['patterns'])
+        assert 'Actor' in pattern_names
+
+    def test_strong_consistency_recommends_outbox(self, mock_blueprint):
+        """Test that strong consistency triggers the Transactional Outbox."""
+        pattern_names = "\n".join(p['name'] for p in mock_blueprint['patterns'])
+        assert 'Transactional Outbox' in pattern_names
+
+    @pytest.mark.parametrize("wrap", [list, iter])
+    def test_display_blueprint(self, configured_advisor, mock_blueprint, capsys, wrap):
+        """Test that the blueprint renders from a list or a one-shot iterator."""
+        blueprint = dict(mock_blueprint, patterns=wrap(mock_blueprint['patterns']))
+
+        configured_advisor._display_blueprint(blueprint)
+
+        output = capsys.readouterr().out
+        assert "1. Transactional Outbox Pattern (ID: pattern-023)" in output
+        assert "3. OpenTelemetry Instrumentation (ID: pattern-007)" in output
+        assert "proto/test-service/v1/service.proto" in output
+
+    def test_run_end_to_end(self, monkeypatch, tmp_path, capsys):
+        """Test a confirmed session from the first prompt to the written artifacts."""
+        import questionary
+
+        # Name, type, throughput, latency, consistency, integrations, team, proceed
+        answers = iter(["orders", "api", "2000", "100", "strong", ["kafka"], "3", True])
+
+        class _Prompt:
+            def __init__(self, *args, **kwargs):
+                pass
+
+            def ask(self):
+                return next(answers)
+
+        for prompt in ("text", "select", "checkbox", "confirm"):
+            monkeypatch.setattr(questionary, prompt, _Prompt)
+        monkeypatch.chdir(tmp_path)
+
+        InteractiveAdvisor().run()
+
+        assert next(answers, None) is None
+        output = capsys.readouterr().out
+        assert "2. Actor Mailbox Backpressure (ID: pattern-001)" in output
+        assert (tmp_path / "orders" / "proto" / "orders" / "v1" / "service.proto").is_file()
+
+    def test_constraint_key_ignores_service_name(self):
+        """Test that renaming a service reuses the cached recommendation."""
+        first, second = InteractiveAdvisor(), InteractiveAdvisor()
+        for advisor, name in ((first, "orders"), (second, "orders-v2")):
+            advisor.constraints = ServiceConstraints(
+                service_name=name, throughput_tps=2000, consistency_model="strong"
+            )
+
+        assert first._constraint_key() == second._constraint_key()
+        # Identity, not equality: the second call must be a cache hit
+        assert (first._generate_blueprint_mock()['patterns'][0]
+                is second._generate_blueprint_mock()['patterns'][0])
+
+    @pytest.mark.parametrize("use_case,expected", [
+        ("processing customer payments", "strong"),
+        ("user authentication service", "strong"),
+        ("social feed for followers", "eventual"),
+        ("bread recipe catalogue", None),
+    ])
+    def test_classify_consistency(self, use_case, expected):
+        """Test keyword-based consistency recommendations."""
+        assert _classify_consistency(use_case) == expected
 
 
 if __name__ == '__main__':
-    pytest.main([__file__, '-v'])
+    # Skip per-test plugin bookkeeping for standalone runs; this file is too
+    # short for xdist workers to pay off
+    pytest.main([
+        __file__, '-v',
+        '-p', 'no:cacheprovider', '-p', 'no:stepwise',
+        '--no-header',
+    ])